@@ -0,0 +1,134 @@
+"""
+ログ出力の有無によるリクエストスループットを計測するベンチマーク
+（requirements-dev.txt の httpx が必要）
+
+使用例:
+    python benchmarks/benchmark_logging.py --requests 500 --rounds 7 2>/dev/null
+    LOG_FORMAT=json LOG_SAMPLE_RATES="/api/events=0.1" python benchmarks/benchmark_logging.py 2>/dev/null
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+# `src`ディレクトリのモジュールをインポートできるようにする
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# main.pyのインポート前に、DB接続なしで動かすための環境変数を設定する
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ALLOWED_ORIGINS", "http://localhost:3000")
+os.environ.setdefault("API_PORT", "8000")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import models
+from database import get_db
+from config import settings
+from logging_config import find_sample_rate, shutdown_logging
+from main import app
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def seed(count: int) -> None:
+    """ベンチマーク用のスケジュールを投入する"""
+    models.Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    base = datetime(2025, 9, 1, 9, 0)
+    for i in range(count):
+        start = base + timedelta(hours=i)
+        db.add(models.Schedule(title=f"schedule {i}", start_time=start, end_time=start + timedelta(hours=1)))
+    db.commit()
+    db.close()
+
+
+def run(client: TestClient, path: str, requests: int) -> float:
+    """指定したパスにリクエストを送り、1リクエストあたりの平均時間（マイクロ秒）を返す"""
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path)
+        response.raise_for_status()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def measure_count_query(requests: int) -> float:
+    """ログ用の全件数COUNTクエリ1回あたりの時間（マイクロ秒）を返す"""
+    db = TestingSessionLocal()
+    start = time.perf_counter()
+    for _ in range(requests):
+        db.query(models.Schedule).count()
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="1ラウンドで計測するリクエスト数")
+    parser.add_argument("--rounds", type=int, default=7, help="ログON/OFFを交互に計測するラウンド数")
+    parser.add_argument("--schedules", type=int, default=200, help="投入するスケジュール件数")
+    args = parser.parse_args()
+
+    seed(args.schedules)
+    app.dependency_overrides[get_db] = override_get_db
+    # /api/events はサンプリングされたリクエストでのみ全件数のCOUNTクエリを実行する
+    paths = {
+        "/api/events?year=2025&month=9": True,
+        "/api/schedules?year=2025&month=9": False,
+    }
+    sample_rates = settings.log_sample_rates
+    # TestClient(httpx)自身のINFOログはサーバーのログではないので計測から除外する
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    with TestClient(app) as client:
+        # ウォームアップ
+        for path in paths:
+            run(client, path, 50)
+
+        # ログOFFではCOUNTクエリも省かれるため、その分は別に計測して差し引く
+        count_us = statistics.median(measure_count_query(args.requests) for _ in range(args.rounds))
+        print(f"全件数COUNTクエリ: {count_us:.1f} us/回")
+
+        for path, runs_count in paths.items():
+            on_times, off_times = [], []
+            for i in range(args.rounds):
+                # 実行順による偏りを避けるため、ラウンドごとにON/OFFの順番を入れ替える
+                for logging_on in ((True, False) if i % 2 == 0 else (False, True)):
+                    logging.disable(logging.NOTSET if logging_on else logging.CRITICAL)
+                    (on_times if logging_on else off_times).append(run(client, path, args.requests))
+            logging.disable(logging.NOTSET)
+
+            logging_on = statistics.median(on_times)
+            logging_off = statistics.median(off_times)
+            count_cost = count_us * find_sample_rate(path.split("?")[0], sample_rates) if runs_count else 0.0
+            overhead = logging_on - logging_off - count_cost
+            print(
+                f"{path}: ログON {logging_on:.1f} us/req, ログOFF {logging_off:.1f} us/req, "
+                f"COUNT分 {count_cost:.1f} us/req, ログ処理のオーバーヘッド {overhead:.1f} us/req "
+                f"({overhead / logging_off * 100:.1f}%)"
+            )
+
+    shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
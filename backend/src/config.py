@@ -1,11 +1,37 @@
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Literal
+from logging_config import parse_sample_rates
 
 class Settings(BaseSettings):
     DEBUG: bool = False
     DATABASE_URL: str
     ALLOWED_ORIGINS: str
     API_PORT: int
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    # "text" または "json"
+    LOG_FORMAT: Literal["text", "json"] = "text"
+    # パスの前方一致ごとのINFO以下のログのサンプリング率（例: "/api/events=0.1,/api/delete-schedule/=0.5"）
+    LOG_SAMPLE_RATES: str = ""
+
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def normalize_log_level(cls, value):
+        """大文字・小文字を区別せずに指定できるようにする（例: "info" -> "INFO"）"""
+        return value.strip().upper() if isinstance(value, str) else value
+
+    @field_validator("LOG_FORMAT", mode="before")
+    @classmethod
+    def normalize_log_format(cls, value):
+        """大文字・小文字を区別せずに指定できるようにする（例: "JSON" -> "json"）"""
+        return value.strip().lower() if isinstance(value, str) else value
+
+    @field_validator("LOG_SAMPLE_RATES")
+    @classmethod
+    def validate_log_sample_rates(cls, value: str) -> str:
+        """起動時に形式と値の範囲をチェックする"""
+        parse_sample_rates(value)
+        return value
 
     @property
     def origins_list(self) -> List[str]:
@@ -14,4 +40,9 @@ class Settings(BaseSettings):
         例: "http://a.com,http://b.com" -> ["http://a.com", "http://b.com"]
         """
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(',')]
+
+    @property
+    def log_sample_rates(self) -> Dict[str, float]:
+        """LOG_SAMPLE_RATESをパスとサンプリング率の辞書に変換する"""
+        return parse_sample_rates(self.LOG_SAMPLE_RATES)
 settings = Settings()
\ No newline at end of file
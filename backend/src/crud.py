@@ -5,6 +5,7 @@ from datetime import datetime, date
 import logging
 import schemas
 from sqlalchemy.types import String
+from logging_config import log_sampled
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +70,7 @@ def get_schedules(
 # ✅ 修正版：日付範囲での年月取得
 def get_schedules_by_month(db: Session, year: int, month: int):
     """start_timeから年月でスケジュールを取得（日付範囲使用）"""
-    logger.info(f"📅 CRUD: 年月検索 {year}年{month}月")
+    logger.info("📅 CRUD: 年月検索 %s年%s月", year, month)
     try:
         # ✅ 指定年月の開始日と終了日を計算
         # 前月、翌月の一部も表示するため、前後3ヶ月分を取得
@@ -84,19 +85,20 @@ def get_schedules_by_month(db: Session, year: int, month: int):
         else:
             end_date = datetime(year, month + 1, 1)
         
-        logger.info(f"📅 検索範囲: {start_date} ~ {end_date}")
+        logger.info("📅 検索範囲: %s ~ %s", start_date, end_date)
         
         # ✅ start_timeが指定範囲内のレコードを取得
         schedules = db.query(models.Schedule).filter(
             models.Schedule.start_time >= start_date,
             models.Schedule.start_time < end_date
         ).order_by(models.Schedule.start_time.asc()).all()
-        schedules_all = db.query(models.Schedule).all()
-        logger.info(f"✅ CRUD: {len(schedules)}件取得")
-        logger.info(f"📅 全件数: {len(schedules_all)}件")
+        logger.info("✅ CRUD: %d件取得", len(schedules))
+        # 全件数はログ出力のためだけに使うので、出力されないリクエストではクエリ自体を省く
+        if logger.isEnabledFor(logging.INFO) and log_sampled.get():
+            logger.info("📅 全件数: %d件", db.query(models.Schedule).count())
         return schedules
     except Exception as e:
-        logger.error(f"❌ CRUD エラー（日付範囲使用）: {str(e)}")
+        logger.error("❌ CRUD エラー（日付範囲使用）: %s", e)
         # ✅ フォールバック: extract を使用
         try:
             logger.info("📅 フォールバック: extract関数を使用")
@@ -104,16 +106,16 @@ def get_schedules_by_month(db: Session, year: int, month: int):
                 extract('year', models.Schedule.start_time) == year,
                 extract('month', models.Schedule.start_time) == month
             ).order_by(models.Schedule.start_time.asc()).all()
-            logger.info(f"✅ フォールバック成功: {len(schedules)}件取得")
+            logger.info("✅ フォールバック成功: %d件取得", len(schedules))
             return schedules
         except Exception as fallback_error:
-            logger.error(f"❌ フォールバックも失敗: {str(fallback_error)}")
+            logger.error("❌ フォールバックも失敗: %s", fallback_error)
             # ✅ 最終フォールバック: 全件取得
             try:
                 logger.info("📅 最終フォールバック: 全件取得")
                 schedules = db.query(models.Schedule).all()
-                logger.info(f"✅ 最終フォールバック成功: {len(schedules)}件取得")
+                logger.info("✅ 最終フォールバック成功: %d件取得", len(schedules))
                 return schedules
             except Exception as final_error:
-                logger.error(f"❌ 最終フォールバックも失敗: {str(final_error)}")
+                logger.error("❌ 最終フォールバックも失敗: %s", final_error)
                 return []
\ No newline at end of file
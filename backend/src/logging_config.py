@@ -0,0 +1,162 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import math
+import queue
+import random
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# 現在処理中のリクエストのパス（ミドルウェアで設定し、JSONログに出力する）
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+# 現在のリクエストのINFO以下のログを出力するかどうか（リクエストごとに1回だけ決定する）
+log_sampled: ContextVar[bool] = ContextVar("log_sampled", default=True)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    ログレコードを1行のJSONに変換するフォーマッタ
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        route = getattr(record, "route", None)
+        if route is not None:
+            payload["route"] = route
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class RouteSamplingFilter(logging.Filter):
+    """
+    ミドルウェアが決めたサンプリング結果に従ってログを間引くフィルタ
+    WARNING以上のログは常に通す。
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.route = current_route.get()
+        if record.levelno >= logging.WARNING:
+            return True
+        return log_sampled.get()
+
+
+def find_sample_rate(path: str, rates: Dict[str, float]) -> float:
+    """
+    パスに前方一致するキーのうち最も長いもののサンプリング率を返す。
+    一致するキーがなければ1.0（すべて出力）を返す。
+    """
+    prefix = max((key for key in rates if path.startswith(key)), key=len, default=None)
+    return 1.0 if prefix is None else rates[prefix]
+
+
+class LogSamplingMiddleware:
+    """
+    リクエストごとにログを出力するかを決め、コンテキスト変数に保存するASGIミドルウェア
+    サンプリング率のキーはパスの前方一致で照合し、最も長く一致したものを使う。
+    （例: "/api/delete-schedule/" は "/api/delete-schedule/1" などすべてに一致する）
+    """
+    def __init__(self, app, rates: Dict[str, float]):
+        self.app = app
+        self.rates = rates
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        rate = find_sample_rate(path, self.rates)
+        route_token = current_route.set(path)
+        sampled_token = log_sampled.set(rate >= 1.0 or random.random() < rate)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            log_sampled.reset(sampled_token)
+            current_route.reset(route_token)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    メッセージの整形をリスナースレッドに任せるQueueHandler
+    標準のQueueHandlerはprepare()で呼び出し元スレッドで整形してしまうため、
+    レコードをそのままキューに積む。（同一プロセス内のキューのみで使用すること）
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """
+    LOG_SAMPLE_RATESの文字列を辞書に変換する。
+    例: "/api/events=0.1,/api/schedules=0.5" -> {"/api/events": 0.1, "/api/schedules": 0.5}
+    """
+    rates = {}
+    for item in value.split(','):
+        if not item.strip():
+            continue
+        route, sep, rate = item.partition('=')
+        route = route.strip()
+        if not sep or not route:
+            raise ValueError(f"LOG_SAMPLE_RATES: '{item.strip()}' は '<パス>=<率>' の形式で指定してください")
+        try:
+            parsed = float(rate)
+        except ValueError:
+            raise ValueError(f"LOG_SAMPLE_RATES: '{route}' のサンプリング率 '{rate.strip()}' が数値ではありません") from None
+        if not math.isfinite(parsed) or not (0.0 <= parsed <= 1.0):
+            raise ValueError(f"LOG_SAMPLE_RATES: '{route}' のサンプリング率は0から1の範囲で指定してください")
+        rates[route] = parsed
+    return rates
+
+
+def setup_logging(settings) -> None:
+    """
+    設定に従ってルートロガーを構成する。
+    リクエストスレッドではキューに積むだけにし、出力はQueueListenerのスレッドで行う。
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    stream_handler = logging.StreamHandler()
+    if settings.LOG_FORMAT.lower() == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RouteSamplingFilter())
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    # uvicornのロガーは独自のStreamHandlerで同期的に出力するため、ルートのキューに流す
+    for name in ("uvicorn", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        for handler in uvicorn_logger.handlers[:]:
+            uvicorn_logger.removeHandler(handler)
+        uvicorn_logger.propagate = True
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """キューに残っているログを出力してリスナーを停止する"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -7,12 +7,13 @@ import models
 import schemas
 from database import engine, get_db
 from config import settings
+from logging_config import setup_logging, LogSamplingMiddleware
 import logging
 import subprocess
 import os
 
 # ログ設定
-logging.basicConfig(level=logging.INFO)
+setup_logging(settings)
 logger = logging.getLogger(__name__)
 
 app = FastAPI()
@@ -27,6 +28,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# リクエストごとにログのサンプリングを決定する
+app.add_middleware(LogSamplingMiddleware, rates=settings.log_sample_rates)
+
 @app.get("/")
 def read_root():
     return {"message": "Hello from FastAPI!", "debug_mode": settings.DEBUG}
@@ -49,7 +53,7 @@ def get_events(
     - GET /api/events (全イベント)
     """
     
-    logger.info(f"📡 API呼び出し: year={year}, month={month}, date={date}, limit={limit}")
+    logger.info("📡 API呼び出し: year=%s, month=%s, date=%s, limit=%s", year, month, date, limit)
     
     try:
         schedules = []  # ✅ 初期化を必ず行う
@@ -60,15 +64,15 @@ def get_events(
         if year < 1900 or year > 2100:
             raise HTTPException(status_code=400, detail="Year must be between 1900 and 2100")
         
-        logger.info(f"📅 年月検索（シンプル版）: {year}年{month}月")
+        logger.info("📅 年月検索（シンプル版）: %s年%s月", year, month)
         # ✅ 一時的にシンプル版を使用
         schedules = crud.get_schedules_by_month(db=db, year=year, month=month)
         
-        logger.info(f"✅ 取得結果: {len(schedules)}件")
+        logger.info("✅ 取得結果: %d件", len(schedules))
         return schedules
 
     except Exception as e:
-        logger.error(f"❌ 予期しないエラー: {str(e)}")
+        logger.error("❌ 予期しないエラー: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {str(e)}")
 
 # スケジュール追加エンドポイント
@@ -79,7 +83,7 @@ def add_schedule(schedule: schemas.ScheduleCreate, db: Session = Depends(get_db)
         new_schedule = crud.create_schedule(db=db, schedule=schedule)
         return new_schedule
     except Exception as e:
-        logger.error(f"❌ 予期しないエラー: {str(e)}")
+        logger.error("❌ 予期しないエラー: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {str(e)}")
 
 @app.delete("/api/delete-schedule/{schedule_id}", response_model=schemas.ScheduleGet, status_code=status.HTTP_200_OK)
@@ -91,7 +95,7 @@ def delete_schedule(schedule_id: int, db: Session = Depends(get_db)):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schedule not found")
         return deleted_schedule
     except Exception as e:
-        logger.error(f"❌ 予期しないエラー: {str(e)}")
+        logger.error("❌ 予期しないエラー: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {str(e)}")
 
 @app.get("/api/schedules", response_model=List[schemas.ScheduleGet], status_code=status.HTTP_200_OK)
@@ -105,10 +109,10 @@ def get_schedules(
     try:
         schedules = []
         schedules = crud.get_schedules(db=db, tag=tag, year=year, month=month, day=day)
-        logger.info(f"✅ 取得結果: {len(schedules)}件")
+        logger.info("✅ 取得結果: %d件", len(schedules))
         return schedules
     except Exception as e:
-        logger.error(f"❌ 予期しないエラー: {str(e)}")
+        logger.error("❌ 予期しないエラー: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {str(e)}")
     
 # データベースシード実行エンドポイント
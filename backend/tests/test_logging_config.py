@@ -0,0 +1,183 @@
+import asyncio
+import io
+import json
+import logging
+import sys
+import types
+
+import pytest
+
+import logging_config
+from logging_config import (
+    JsonFormatter,
+    LogSamplingMiddleware,
+    RouteSamplingFilter,
+    current_route,
+    find_sample_rate,
+    log_sampled,
+    parse_sample_rates,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def make_record(level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def run_middleware(rates, path):
+    """ミドルウェア経由でアプリを呼び出し、アプリ内で見えたコンテキスト変数を返す"""
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["route"] = current_route.get()
+        seen["sampled"] = log_sampled.get()
+
+    middleware = LogSamplingMiddleware(app, rates)
+    asyncio.run(middleware({"type": "http", "path": path}, None, None))
+    return seen
+
+
+# --- parse_sample_rates ---
+
+def test_parse_sample_rates():
+    assert parse_sample_rates("/api/events=0.1, /api/schedules = 1 ,") == {
+        "/api/events": 0.1,
+        "/api/schedules": 1.0,
+    }
+
+
+def test_parse_sample_rates_empty():
+    assert parse_sample_rates("") == {}
+
+
+@pytest.mark.parametrize("value", ["/api/events", "=0.5", "/api/events=abc", "/api/events=", "/api/events=nan", "/api/events=inf", "/api/events=1.5", "/api/events=-0.1"])
+def test_parse_sample_rates_invalid(value):
+    with pytest.raises(ValueError, match="LOG_SAMPLE_RATES"):
+        parse_sample_rates(value)
+
+
+# --- RouteSamplingFilter ---
+
+def test_filter_passes_outside_request():
+    record = make_record()
+    assert RouteSamplingFilter().filter(record) is True
+    assert record.route is None
+
+
+def test_filter_drops_unsampled_info():
+    token = log_sampled.set(False)
+    try:
+        assert RouteSamplingFilter().filter(make_record()) is False
+    finally:
+        log_sampled.reset(token)
+
+
+def test_filter_always_passes_warning():
+    token = log_sampled.set(False)
+    try:
+        assert RouteSamplingFilter().filter(make_record(level=logging.WARNING)) is True
+        assert RouteSamplingFilter().filter(make_record(level=logging.ERROR)) is True
+    finally:
+        log_sampled.reset(token)
+
+
+# --- find_sample_rate ---
+
+def test_find_sample_rate_longest_prefix():
+    rates = {"/api/": 0.5, "/api/delete-schedule/": 0.1}
+    assert find_sample_rate("/api/delete-schedule/42", rates) == 0.1
+    assert find_sample_rate("/api/events", rates) == 0.5
+    assert find_sample_rate("/", rates) == 1.0
+
+
+# --- LogSamplingMiddleware ---
+
+def test_middleware_rate_zero_drops():
+    assert run_middleware({"/api/events": 0.0}, "/api/events") == {"route": "/api/events", "sampled": False}
+
+
+def test_middleware_unconfigured_route_is_sampled():
+    assert run_middleware({"/api/events": 0.0}, "/api/schedules")["sampled"] is True
+
+
+def test_middleware_prefix_match():
+    rates = {"/api/delete-schedule/": 0.0, "/api/": 1.0}
+    assert run_middleware(rates, "/api/delete-schedule/42")["sampled"] is False
+    assert run_middleware(rates, "/api/events")["sampled"] is True
+
+
+def test_middleware_resets_context():
+    run_middleware({"/api/events": 0.0}, "/api/events")
+    assert current_route.get() is None
+    assert log_sampled.get() is True
+
+
+# --- JsonFormatter ---
+
+def test_json_formatter():
+    record = make_record()
+    record.route = "/api/events"
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "test"
+    assert payload["message"] == "hello world"
+    assert payload["route"] == "/api/events"
+    assert "exc_info" not in payload
+
+
+def test_json_formatter_exception():
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "boom", (), sys.exc_info())
+    payload = json.loads(JsonFormatter().format(record))
+    assert "route" not in payload
+    assert "ZeroDivisionError" in payload["exc_info"]
+
+
+# --- setup_logging（DeferredQueueHandler + QueueListener） ---
+
+def test_setup_logging_end_to_end():
+    stream = io.StringIO()
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    settings = types.SimpleNamespace(LOG_LEVEL="info", LOG_FORMAT="json")
+    try:
+        setup_logging(settings)
+        logging_config._listener.handlers[0].setStream(stream)
+        assert isinstance(root.handlers[0], logging_config.DeferredQueueHandler)
+        logger = logging.getLogger("e2e")
+        logger.debug("debug is below level")
+        logger.info("kept %d", 1)
+        token = log_sampled.set(False)
+        try:
+            logger.info("dropped")
+            logger.error("error %s", "kept")
+        finally:
+            log_sampled.reset(token)
+    finally:
+        shutdown_logging()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["kept 1", "error kept"]
+    assert [line["level"] for line in lines] == ["INFO", "ERROR"]
+
+
+def test_setup_logging_routes_uvicorn_through_queue():
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    access = logging.getLogger("uvicorn.access")
+    access.addHandler(logging.StreamHandler(io.StringIO()))
+    access.propagate = False
+    try:
+        setup_logging(types.SimpleNamespace(LOG_LEVEL="INFO", LOG_FORMAT="text"))
+        assert access.handlers == []
+        assert access.propagate is True
+        assert logging.getLogger("uvicorn").propagate is True
+    finally:
+        shutdown_logging()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
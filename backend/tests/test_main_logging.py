@@ -0,0 +1,120 @@
+import io
+import json
+import logging
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic_settings")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def app_env(monkeypatch):
+    """
+    /api/events のサンプリング率を0にしたアプリをインメモリSQLiteで起動し、
+    (TestClient, ログ出力先, 実行されたSQLのリスト, セッションファクトリ) を返す
+    """
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    monkeypatch.setenv("ALLOWED_ORIGINS", "http://localhost:3000")
+    monkeypatch.setenv("API_PORT", "8000")
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    monkeypatch.setenv("LOG_SAMPLE_RATES", "/api/events=0")
+    # 設定はインポート時に読み込まれるため、環境変数を設定してから読み込み直す
+    for name in ("config", "database", "crud", "main"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+
+    import logging_config
+    import main
+    import models
+    from database import get_db
+
+    stream = io.StringIO()
+    logging_config._listener.handlers[0].setStream(stream)
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    start = datetime(2025, 9, 10, 9, 0)
+    db.add(models.Schedule(title="meeting", start_time=start, end_time=start + timedelta(hours=1)))
+    db.commit()
+    db.close()
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lower())
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(main.app) as client:
+            yield client, stream, statements, SessionLocal
+    finally:
+        main.app.dependency_overrides.clear()
+        logging_config.shutdown_logging()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+def read_records(stream):
+    import logging_config
+
+    # リスナーを止めてキューに残っているログを書き出す
+    logging_config.shutdown_logging()
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    return [record for record in records if record["logger"] != "httpx"]
+
+
+def test_unsampled_request_skips_info_logs_and_count_query(app_env):
+    client, stream, statements, _ = app_env
+
+    response = client.get("/api/events", params={"year": 2025, "month": 9})
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert not [record for record in read_records(stream) if record["level"] == "INFO"]
+    assert statements
+    assert not [statement for statement in statements if "count(" in statement]
+
+
+def test_sampled_request_emits_info_logs(app_env):
+    client, stream, _, _ = app_env
+
+    response = client.get("/api/schedules", params={"year": 2025, "month": 9})
+
+    assert response.status_code == 200
+    records = read_records(stream)
+    assert any(record["level"] == "INFO" and record.get("route") == "/api/schedules" for record in records)
+
+
+def test_count_query_runs_outside_sampling(app_env):
+    _, _, statements, SessionLocal = app_env
+    import crud
+
+    db = SessionLocal()
+    try:
+        crud.get_schedules_by_month(db=db, year=2025, month=9)
+    finally:
+        db.close()
+
+    assert [statement for statement in statements if "count(" in statement]